@@ -3,11 +3,25 @@
 This implements a 4-player Canasta game following Pagat Classic rules.
 """
 
+import base64
+import json
+from itertools import islice
+
 import numpy as np
 import pyspiel
 from open_spiel.python.observation import IIGObserverForPublicInfoGame
 
-from canasta.cards import NUM_CARDS, is_red_three, is_wild, is_black_three, rank_of, card_point_value
+from canasta.cards import (
+    NUM_CARDS,
+    RANKS,
+    RED_THREE_IDS,
+    card_id_to_rank_suit,
+    is_red_three,
+    is_wild,
+    is_black_three,
+    rank_of,
+    card_point_value,
+)
 from canasta.deck import NUM_PLAYERS, HAND_SIZE, create_deck, deal_hands
 from canasta.melds import (
     Meld,
@@ -25,6 +39,10 @@ _NUM_PLAYERS = NUM_PLAYERS
 _HAND_SIZE = HAND_SIZE
 _NUM_CARDS = NUM_CARDS
 
+# Plain-int chance player ID; comparing an int against the pybind11
+# PlayerId enum is several times slower than an int compare
+_CHANCE_PLAYER = int(pyspiel.PlayerId.CHANCE)
+
 # Action encoding
 # Draw phase:
 #   0: DRAW_STOCK - draw top card from stock pile
@@ -58,6 +76,34 @@ ACTION_ANSWER_GO_OUT_YES = 2111
 ACTION_ANSWER_GO_OUT_NO = 2112
 ACTION_GO_OUT = 2113
 
+
+def _discard_action_string(card_id):
+    """Describe the discard action for card_id."""
+    rank, suit = card_id_to_rank_suit(card_id)
+    if suit:
+        return f"Discard {rank} of {suit}"
+    return f"Discard {rank}"
+
+
+# Strings for the actions whose description does not depend on the state.
+# Meld actions are excluded since their card counts are decoded from the hand.
+_STATIC_ACTION_STRINGS = {
+    ACTION_DRAW_STOCK: "Draw from stock",
+    ACTION_TAKE_PILE: "Take discard pile",
+    ACTION_SKIP_MELD: "Skip meld",
+    ACTION_ASK_PARTNER_GO_OUT: "Ask partner: May I go out?",
+    ACTION_ANSWER_GO_OUT_YES: "Partner answers: Yes, go out",
+    ACTION_ANSWER_GO_OUT_NO: "Partner answers: No, don't go out",
+    ACTION_GO_OUT: "Go out",
+    **{
+        ACTION_DISCARD_START + card_id: _discard_action_string(card_id)
+        for card_id in range(NUM_CARDS)
+    },
+}
+
+# Format version written by CanastaState.serialize()
+_SERIALIZATION_VERSION = 1
+
 _GAME_TYPE = pyspiel.GameType(
     short_name="python_canasta",
     long_name="Python Canasta",
@@ -93,6 +139,13 @@ class CanastaGame(pyspiel.Game):
 
     def __init__(self, params=None):
         super().__init__(_GAME_TYPE, _GAME_INFO, params or dict())
+        self._tensor_observer = None  # Lazily created, shared by all states
+
+    def _get_tensor_observer(self):
+        """Returns the observer reused by state tensor methods."""
+        if self._tensor_observer is None:
+            self._tensor_observer = self.make_py_observer()
+        return self._tensor_observer
 
     def new_initial_state(self):
         """Returns a state corresponding to the start of a game."""
@@ -167,7 +220,7 @@ class CanastaState(pyspiel.State):
 
         # Reset deck and dealing
         self._deck = create_deck()
-        self._hands = [[] for _ in range(self._num_players)]
+        self._clear_hands()
         self._stock = []
         self._discard_pile = []
         self._melds = [[] for _ in range(2)]
@@ -200,6 +253,11 @@ class CanastaState(pyspiel.State):
         self._game_over = False
         self._winning_team = -1
 
+    def _clear_hands(self):
+        """Empty every player's hand in place."""
+        for hand in self._hands:
+            hand.clear()
+
     def current_player(self):
         """Returns id of the next player to move, or TERMINAL if game is over."""
         if self._is_terminal:
@@ -491,16 +549,29 @@ class CanastaState(pyspiel.State):
         # Always can skip melding
         actions.append(ACTION_SKIP_MELD)
 
+        # Bucket the hand by rank in a single pass (preserving hand order)
+        # instead of rescanning it for every rank and every meld below
+        wild_cards = []
+        naturals_by_rank = [[] for _ in range(13)]
+        for c in hand:
+            if is_wild(c):
+                wild_cards.append(c)
+            else:
+                naturals_by_rank[rank_of(c)].append(c)
+
+        # _can_create_meld() rejects every combination for a rank the team
+        # has already melded, so skip those ranks without trying any
+        melded_ranks = {meld.rank for meld in self._melds[team]}
+
         # Generate CREATE_MELD actions
         # For each rank (0-12), try to form melds with combinations of cards
         for rank_idx in range(13):
             # Skip rank 1 (2s are wild) and rank 2 (3s cannot be melded normally)
-            if rank_idx == 1 or rank_idx == 2:
+            if rank_idx == 1 or rank_idx == 2 or rank_idx in melded_ranks:
                 continue
 
             # Find cards of this rank in hand
-            natural_cards = [c for c in hand if not is_wild(c) and rank_of(c) == rank_idx]
-            wild_cards = [c for c in hand if is_wild(c)]
+            natural_cards = naturals_by_rank[rank_idx]
 
             # Try different combinations of natural and wild cards
             # Need at least 2 naturals, at most 3 wilds, at least 3 total
@@ -522,8 +593,7 @@ class CanastaState(pyspiel.State):
         # Generate ADD_TO_MELD actions
         for meld_idx, meld in enumerate(self._melds[team]):
             # Find cards that can be added to this meld
-            natural_cards = [c for c in hand if not is_wild(c) and rank_of(c) == meld.rank]
-            wild_cards = [c for c in hand if is_wild(c)]
+            natural_cards = naturals_by_rank[meld.rank]
 
             # Try adding individual cards or combinations
             # Add natural cards
@@ -760,61 +830,58 @@ class CanastaState(pyspiel.State):
         """
         player = self._current_player
         team = player % 2
-        hand = self._hands[player].copy()
-
-        # Try each card as the potential discard
-        for discard_candidate in hand:
-            remaining_cards = [c for c in hand if c != discard_candidate]
-
-            # Check if can meld all remaining cards
-            if self._can_meld_all_cards(remaining_cards, team):
-                return True
+        return self._find_go_out_discard(self._hands[player], team) is not None
 
-        return False
+    def _find_go_out_discard(self, hand, team):
+        """Find the first card whose discard leaves a fully meldable hand.
 
-    def _can_meld_all_cards(self, cards, team):
-        """Check if all given cards can be melded.
+        Equivalent to removing each card in turn and checking that every
+        remaining natural either joins an existing meld or has at least one
+        matching natural to start a new one, but counts ranks once instead of
+        rebuilding the remaining hand for every candidate.
 
         Args:
-            cards: List of card IDs to try melding
+            hand: List of card IDs in hand
             team: Team index
 
         Returns:
-            True if all cards can be melded
+            Card ID to discard, or None if no such card exists
         """
-        # Group cards by rank
-        cards_by_rank = {}
-        wild_cards = []
+        melded_ranks = {meld.rank for meld in self._melds[team]}
 
-        for card in cards:
-            if is_wild(card):
-                wild_cards.append(card)
-            else:
+        rank_counts = {}
+        for card in hand:
+            if not is_wild(card):
                 r = rank_of(card)
-                if r not in cards_by_rank:
-                    cards_by_rank[r] = []
-                cards_by_rank[r].append(card)
-
-        # Try to meld all natural cards
-        for rank_idx, rank_cards in cards_by_rank.items():
-            # Check if team already has a meld for this rank
-            existing_meld = None
-            for meld in self._melds[team]:
-                if meld.rank == rank_idx:
-                    existing_meld = meld
-                    break
-
-            if existing_meld:
-                # Can add to existing meld
+                rank_counts[r] = rank_counts.get(r, 0) + 1
+
+        # Ranks that would need a new meld but only have a single natural
+        num_singles = sum(
+            1 for r, count in rank_counts.items()
+            if count == 1 and r not in melded_ranks
+        )
+        if num_singles > 1:
+            return None
+
+        for card in hand:
+            if is_wild(card):
+                # Wilds can always be melded, so the hand must already be clean
+                if num_singles == 0:
+                    return card
                 continue
-            else:
-                # Need to form new meld - requires at least 2 naturals
-                if len(rank_cards) < 2:
-                    # Try to use wilds, but need at least 2 naturals
-                    return False
 
-        # All cards can be melded
-        return True
+            r = rank_of(card)
+            if r in melded_ranks:
+                if num_singles == 0:
+                    return card
+            elif rank_counts[r] == 1:
+                # Discarding the only single leaves every rank meldable
+                return card
+            elif rank_counts[r] > 2 and num_singles == 0:
+                # A pair would be broken into a single, so only 3+ qualify
+                return card
+
+        return None
 
     def _is_concealed_go_out(self):
         """Check if going out would be concealed.
@@ -873,9 +940,7 @@ class CanastaState(pyspiel.State):
                 melded_cards.extend(meld.wild_cards)
 
             # Collect cards in hands for this team (players t and t+2)
-            hand_cards = []
-            hand_cards.extend(self._hands[t])
-            hand_cards.extend(self._hands[t + 2])
+            hand_cards = self._hands[t] + self._hands[t + 2]
 
             # Count red threes
             red_three_count = len(self._red_threes[t])
@@ -898,10 +963,8 @@ class CanastaState(pyspiel.State):
 
         # Set returns (teammates share team scores)
         # Players 0 and 2 are Team 0, players 1 and 3 are Team 1
-        self._returns[0] = float(self._team_scores[0])
-        self._returns[2] = float(self._team_scores[0])
-        self._returns[1] = float(self._team_scores[1])
-        self._returns[3] = float(self._team_scores[1])
+        team0_return, team1_return = map(float, self._team_scores)
+        self._returns[:] = (team0_return, team1_return, team0_return, team1_return)
 
         # Check if either team has reached the target score
         if self._team_scores[0] >= self._target_score or self._team_scores[1] >= self._target_score:
@@ -934,12 +997,7 @@ class CanastaState(pyspiel.State):
         hand = self._hands[player].copy()
 
         # Find which card to discard
-        discard_card = None
-        for card in hand:
-            remaining = [c for c in hand if c != card]
-            if self._can_meld_all_cards(remaining, team):
-                discard_card = card
-                break
+        discard_card = self._find_go_out_discard(hand, team)
 
         if discard_card is None:
             # Shouldn't happen if validation correct, but handle gracefully
@@ -990,7 +1048,7 @@ class CanastaState(pyspiel.State):
 
     def _legal_actions(self, player):
         """Returns a list of legal actions for the given player."""
-        if player == pyspiel.PlayerId.CHANCE:
+        if player == _CHANCE_PLAYER:
             # During dealing, any card remaining in deck is a legal action
             return list(range(len(self._deck)))
 
@@ -1057,7 +1115,7 @@ class CanastaState(pyspiel.State):
 
     def chance_outcomes(self):
         """Returns the possible chance outcomes and their probabilities."""
-        assert self.is_chance_node()
+        assert self._dealing_phase and not self._is_terminal
 
         # During dealing, each remaining card has equal probability
         num_cards = len(self._deck)
@@ -1067,6 +1125,32 @@ class CanastaState(pyspiel.State):
         prob = 1.0 / num_cards
         return [(card_idx, prob) for card_idx in range(num_cards)]
 
+    def chance_outcomes_iter(self):
+        """Lazily yields the same (action, probability) pairs as chance_outcomes().
+
+        Callers that only need the first outcome can take next() on this
+        without building the full list of remaining cards.
+        """
+        assert self._dealing_phase and not self._is_terminal
+
+        num_cards = len(self._deck)
+        if num_cards == 0:
+            return
+
+        prob = 1.0 / num_cards
+        for card_idx in range(num_cards):
+            yield card_idx, prob
+
+    def _deal_all_deterministic(self):
+        """Finish dealing by always dealing the first remaining card.
+
+        Same result as repeatedly applying chance_outcomes()[0][0], without
+        building the outcome list for every card. Useful for tests and
+        benchmarks that need a reproducible dealt state.
+        """
+        while self._dealing_phase and not self._is_terminal:
+            self.apply_action(0)
+
     def _apply_draw_stock(self):
         """Draw top card from stock pile."""
         if not self._stock:
@@ -1075,21 +1159,24 @@ class CanastaState(pyspiel.State):
         player = self._current_player
         team = player % 2
 
-        # Draw card from stock (from the front of the list, index 0)
+        # Draw card from stock (from the front of the list, index 0). The
+        # stock never exceeds ~63 cards, so pop(0) is cheap and keeps the
+        # stock a plain list with its top card first
         card = self._stock.pop(0)
-        self._hands[player].append(card)
 
-        # Auto-replace red 3s
-        while card in self._hands[player] and is_red_three(card):
-            self._hands[player].remove(card)
+        # Auto-replace red 3s before they reach the hand, so the hand never
+        # has to be searched for the card just drawn
+        while card in RED_THREE_IDS:
             self._red_threes[team].append(card)
 
             # Draw replacement if stock not empty
-            if self._stock:
-                card = self._stock.pop(0)
-                self._hands[player].append(card)
-            else:
+            if not self._stock:
+                card = None
                 break
+            card = self._stock.pop(0)
+
+        if card is not None:
+            self._hands[player].append(card)
 
         # Clear black 3 blocking (only blocks immediate next player)
         self._black_three_blocks_next = False
@@ -1103,16 +1190,16 @@ class CanastaState(pyspiel.State):
         team = player % 2
 
         # Add all cards from pile to hand
-        for card in self._discard_pile:
-            self._hands[player].append(card)
+        self._hands[player].extend(self._discard_pile)
 
         # Process red 3s
-        red_threes = [card for card in self._hands[player] if is_red_three(card)]
-        for red_three in red_threes:
-            self._hands[player].remove(red_three)
-            self._red_threes[team].append(red_three)
-
-            # No replacement for red 3s from pile (only from stock)
+        # One pass splits the hand instead of a list.remove() per red 3.
+        # No replacement for red 3s from pile (only from stock).
+        keep, moved = [], []
+        for card in self._hands[player]:
+            (moved if card in RED_THREE_IDS else keep).append(card)
+        self._hands[player] = keep
+        self._red_threes[team].extend(moved)
 
         # Clear discard pile
         self._discard_pile = []
@@ -1125,7 +1212,9 @@ class CanastaState(pyspiel.State):
 
     def _apply_action(self, action):
         """Applies the specified action to the state."""
-        if self.is_chance_node():
+        # Read the phase flag directly rather than round-tripping through
+        # is_chance_node() -> current_player() on every action.
+        if self._dealing_phase:
             # Dealing phase: action is an index into the remaining deck
             card = self._deck.pop(action)
 
@@ -1210,38 +1299,19 @@ class CanastaState(pyspiel.State):
 
     def _action_to_string(self, player, action):
         """Action -> string representation."""
-        if player == pyspiel.PlayerId.CHANCE:
+        if player == _CHANCE_PLAYER:
             return f"Deal card {action}"
 
-        if action == ACTION_DRAW_STOCK:
-            return "Draw from stock"
-        elif action == ACTION_TAKE_PILE:
-            return "Take discard pile"
-        elif action == ACTION_SKIP_MELD:
-            return "Skip meld"
-        elif ACTION_CREATE_MELD_START <= action <= ACTION_CREATE_MELD_END:
+        static = _STATIC_ACTION_STRINGS.get(action)
+        if static is not None:
+            return static
+
+        if ACTION_CREATE_MELD_START <= action <= ACTION_CREATE_MELD_END:
             rank, card_ids = self._decode_create_meld_action(action)
-            from canasta.cards import RANKS
             return f"Create meld of {RANKS[rank]}s with {len(card_ids)} cards"
         elif ACTION_ADD_TO_MELD_START <= action <= ACTION_ADD_TO_MELD_END:
             meld_idx, card_ids = self._decode_add_to_meld_action(action)
             return f"Add {len(card_ids)} cards to meld {meld_idx}"
-        elif ACTION_DISCARD_START <= action <= ACTION_DISCARD_END:
-            card_id = action - ACTION_DISCARD_START
-            from canasta.cards import card_id_to_rank_suit
-            rank, suit = card_id_to_rank_suit(card_id)
-            if suit:
-                return f"Discard {rank} of {suit}"
-            else:
-                return f"Discard {rank}"
-        elif action == ACTION_ASK_PARTNER_GO_OUT:
-            return "Ask partner: May I go out?"
-        elif action == ACTION_ANSWER_GO_OUT_YES:
-            return "Partner answers: Yes, go out"
-        elif action == ACTION_ANSWER_GO_OUT_NO:
-            return "Partner answers: No, don't go out"
-        elif action == ACTION_GO_OUT:
-            return "Go out"
 
         return f"Action {action}"
 
@@ -1267,7 +1337,7 @@ class CanastaState(pyspiel.State):
             if player < 0:  # CHANCE or TERMINAL
                 player = 0
 
-        observer = self._game.make_py_observer()
+        observer = self._game._get_tensor_observer()
         observer.set_from(self, player)
         return observer.tensor.copy()
 
@@ -1285,51 +1355,54 @@ class CanastaState(pyspiel.State):
             if player < 0:  # CHANCE or TERMINAL
                 player = 0
 
-        observer = self._game.make_py_observer()
+        observer = self._game._get_tensor_observer()
         observer.set_from(self, player)
         return observer.tensor.copy()
 
     def serialize(self):
         """Serialize the state to a string.
 
+        Card lists (hands, stock, discard pile, red threes, melds) are packed
+        as length-prefixed bytes and base64-encoded into a single field of a
+        small JSON header holding the scalar state. Card IDs and list lengths
+        always fit in a byte since there are only 108 cards.
+
         Returns:
             JSON string containing the complete game state
         """
-        import json
+        buf = bytearray()
+        for cards in (*self._hands, self._stock, self._discard_pile, *self._red_threes):
+            buf.append(len(cards))
+            buf += bytes(cards)
 
-        # Serialize melds
-        melds_data = []
         for team_melds in self._melds:
-            team_data = []
+            buf.append(len(team_melds))
             for meld in team_melds:
-                team_data.append({
-                    'rank': meld.rank,
-                    'natural_cards': meld.natural_cards.copy(),
-                    'wild_cards': meld.wild_cards.copy()
-                })
-            melds_data.append(team_data)
+                buf += bytes((meld.rank, len(meld.natural_cards), len(meld.wild_cards)))
+                buf += bytes(meld.natural_cards)
+                buf += bytes(meld.wild_cards)
+
+        buf.append(len(self._red_three_replacements_needed))
+        for player_idx, card in self._red_three_replacements_needed:
+            buf += bytes((player_idx, card))
 
         state_dict = {
-            'hands': [hand.copy() for hand in self._hands],
-            'stock': self._stock.copy(),
-            'discard_pile': self._discard_pile.copy(),
-            'melds': melds_data,
-            'canastas': self._canastas.copy(),
-            'red_threes': [rt.copy() for rt in self._red_threes],
+            'version': _SERIALIZATION_VERSION,
+            'cards': base64.b64encode(buf).decode('ascii'),
+            'canastas': self._canastas,
             'cards_dealt': self._cards_dealt,
-            'red_three_replacements_needed': self._red_three_replacements_needed.copy(),
             'current_player': self._current_player,
             'is_terminal': self._is_terminal,
-            'returns': self._returns.copy(),
-            'team_scores': self._team_scores.copy(),
-            'hand_scores': self._hand_scores.copy(),
+            'returns': self._returns,
+            'team_scores': self._team_scores,
+            'hand_scores': self._hand_scores,
             'hand_number': self._hand_number,
             'target_score': self._target_score,
             'dealing_phase': self._dealing_phase,
             'game_phase': self._game_phase,
             'turn_phase': self._turn_phase,
             'pile_frozen': self._pile_frozen,
-            'initial_meld_made': self._initial_meld_made.copy(),
+            'initial_meld_made': self._initial_meld_made,
             'black_three_blocks_next': self._black_three_blocks_next,
             'go_out_query_pending': self._go_out_query_pending,
             'go_out_query_asker': self._go_out_query_asker,
@@ -1345,19 +1418,46 @@ class CanastaState(pyspiel.State):
         """Deserialize state from a string.
 
         Args:
-            data: JSON string containing the game state
+            data: JSON string produced by serialize()
         """
-        import json
         state_dict = json.loads(data)
 
-        # Restore basic state
-        self._hands = [list(hand) for hand in state_dict['hands']]
-        self._stock = list(state_dict['stock'])
-        self._discard_pile = list(state_dict['discard_pile'])
+        if state_dict.get('version') != _SERIALIZATION_VERSION:
+            raise ValueError(
+                f"Unsupported serialization version: {state_dict.get('version')}"
+            )
+
+        packed = iter(base64.b64decode(state_dict['cards']))
+
+        def read_cards(n=None):
+            if n is None:
+                n = next(packed)
+            return list(islice(packed, n))
+
+        # Restore card lists
+        self._hands = [read_cards() for _ in range(self._num_players)]
+        self._stock = read_cards()
+        self._discard_pile = read_cards()
+        self._red_threes = [read_cards() for _ in range(2)]
+
+        # Restore melds
+        self._melds = [[], []]
+        for team_idx in range(2):
+            for _ in range(next(packed)):
+                rank, num_naturals, num_wilds = read_cards(3)
+                self._melds[team_idx].append(Meld(
+                    rank=rank,
+                    natural_cards=read_cards(num_naturals),
+                    wild_cards=read_cards(num_wilds),
+                ))
+
+        self._red_three_replacements_needed = [
+            tuple(read_cards(2)) for _ in range(next(packed))
+        ]
+
+        # Restore scalar state
         self._canastas = list(state_dict['canastas'])
-        self._red_threes = [list(rt) for rt in state_dict['red_threes']]
         self._cards_dealt = state_dict['cards_dealt']
-        self._red_three_replacements_needed = list(state_dict['red_three_replacements_needed'])
         self._current_player = state_dict['current_player']
         self._is_terminal = state_dict['is_terminal']
         self._returns = list(state_dict['returns'])
@@ -1378,24 +1478,19 @@ class CanastaState(pyspiel.State):
         self._game_over = state_dict['game_over']
         self._winning_team = state_dict['winning_team']
 
-        # Restore melds
-        self._melds = [[], []]
-        for team_idx, team_data in enumerate(state_dict['melds']):
-            for meld_data in team_data:
-                meld = Meld(
-                    rank=meld_data['rank'],
-                    natural_cards=list(meld_data['natural_cards']),
-                    wild_cards=list(meld_data['wild_cards'])
-                )
-                self._melds[team_idx].append(meld)
-
     def clone(self):
         """Create a deep copy of this state.
 
         Returns:
             A new CanastaState instance with copied data
         """
-        cloned = CanastaState(self._game)
+        # Bypass CanastaState.__init__: every field it initializes is
+        # overwritten below, so building a fresh deck and empty containers
+        # first would only be thrown away.
+        cloned = CanastaState.__new__(CanastaState)
+        pyspiel.State.__init__(cloned, self._game)
+        cloned._game = self._game
+        cloned._num_players = self._num_players
 
         # Copy all state variables
         cloned._hands = [hand.copy() for hand in self._hands]
@@ -1438,7 +1533,7 @@ class CanastaState(pyspiel.State):
                 cloned._melds[team_idx].append(cloned_meld)
 
         # Copy deck (might be empty after dealing)
-        cloned._deck = self._deck.copy() if hasattr(self, '_deck') else []
+        cloned._deck = self._deck.copy()
 
         return cloned
 
@@ -11,6 +11,27 @@ NUM_CARDS = 108
 RANKS = ["A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K"]
 SUITS = ["clubs", "diamonds", "hearts", "spades"]
 
+# Card IDs of the four red threes (3 of diamonds/hearts in both decks)
+RED_THREE_IDS = frozenset(
+    deck * 52 + suit_idx * 13 + 2 for deck in (0, 1) for suit_idx in (1, 2)
+)
+
+# Card IDs of the four black threes (3 of clubs/spades in both decks)
+BLACK_THREE_IDS = frozenset(
+    deck * 52 + suit_idx * 13 + 2 for deck in (0, 1) for suit_idx in (0, 3)
+)
+
+# Card IDs of the twelve wild cards (all 2s and the jokers)
+WILD_IDS = frozenset(
+    [deck * 52 + suit_idx * 13 + 1 for deck in (0, 1) for suit_idx in range(4)]
+    + list(range(104, NUM_CARDS))
+)
+
+# Rank index of every card ID (-1 for jokers), indexed by card ID
+_RANK_BY_ID = tuple(
+    (card_id % 52) % 13 if card_id < 104 else -1 for card_id in range(NUM_CARDS)
+)
+
 
 def card_id_to_rank_suit(card_id: int) -> tuple[str, str | None]:
     """Decode card ID to (rank, suit).
@@ -92,12 +113,8 @@ def is_wild(card_id: int) -> bool:
     if card_id < 0 or card_id >= NUM_CARDS:
         raise ValueError(f"Invalid card_id: {card_id}")
 
-    # Jokers
-    if card_id >= 104:
-        return True
-
-    # 2s (rank index 1)
-    return rank_of(card_id) == 1
+    # Jokers and 2s
+    return card_id in WILD_IDS
 
 
 def is_joker(card_id: int) -> bool:
@@ -127,12 +144,7 @@ def is_red_three(card_id: int) -> bool:
     if card_id < 0 or card_id >= NUM_CARDS:
         raise ValueError(f"Invalid card_id: {card_id}")
 
-    # Jokers are not red threes
-    if card_id >= 104:
-        return False
-
-    rank, suit = card_id_to_rank_suit(card_id)
-    return rank == "3" and suit in ["diamonds", "hearts"]
+    return card_id in RED_THREE_IDS
 
 
 def is_black_three(card_id: int) -> bool:
@@ -147,12 +159,7 @@ def is_black_three(card_id: int) -> bool:
     if card_id < 0 or card_id >= NUM_CARDS:
         raise ValueError(f"Invalid card_id: {card_id}")
 
-    # Jokers are not black threes
-    if card_id >= 104:
-        return False
-
-    rank, suit = card_id_to_rank_suit(card_id)
-    return rank == "3" and suit in ["clubs", "spades"]
+    return card_id in BLACK_THREE_IDS
 
 
 def is_natural(card_id: int) -> bool:
@@ -179,13 +186,7 @@ def rank_of(card_id: int) -> int:
     if card_id < 0 or card_id >= NUM_CARDS:
         raise ValueError(f"Invalid card_id: {card_id}")
 
-    # Jokers
-    if card_id >= 104:
-        return -1
-
-    # Standard cards
-    deck_offset = card_id % 52
-    return deck_offset % 13
+    return _RANK_BY_ID[card_id]
 
 
 def cards_of_rank(rank_idx: int) -> list[int]:
@@ -7,7 +7,7 @@ from typing import List
 from canasta.cards import card_point_value, rank_of
 
 
-@dataclass
+@dataclass(slots=True)
 class Meld:
     """Represents a meld of cards.
 
@@ -17,6 +17,9 @@ class Meld:
         wild_cards: List of card IDs for wild cards (2s and jokers)
     """
 
+    # The card lists are extended in place when adding to a meld, so the
+    # class is not frozen and counts are not cached.
+
     rank: int
     natural_cards: List[int]
     wild_cards: List[int]
@@ -38,18 +41,21 @@ def is_valid_meld(meld: Meld, allow_black_threes: bool = False) -> bool:
     Returns:
         True if meld is valid
     """
-    total_cards = len(meld.natural_cards) + len(meld.wild_cards)
+    # Validity depends only on the rank and the two card counts, so take
+    # each length once
+    num_naturals = len(meld.natural_cards)
+    num_wilds = len(meld.wild_cards)
 
     # Rule 1: At least 3 cards
-    if total_cards < 3:
+    if num_naturals + num_wilds < 3:
         return False
 
     # Rule 2: At least 2 natural cards
-    if len(meld.natural_cards) < 2:
+    if num_naturals < 2:
         return False
 
     # Rule 3: At most 3 wild cards
-    if len(meld.wild_cards) > 3:
+    if num_wilds > 3:
         return False
 
     # Rule 4: Cannot meld 2s (rank 1)
@@ -138,12 +144,12 @@ def canasta_bonus(meld: Meld) -> int:
     Returns:
         Bonus points (500, 300, or 0)
     """
-    if is_natural_canasta(meld):
-        return 500
-    elif is_mixed_canasta(meld):
-        return 300
-    else:
+    # Classify with a single pair of length checks rather than going through
+    # is_natural_canasta()/is_mixed_canasta(), which each re-check is_canasta()
+    num_wilds = len(meld.wild_cards)
+    if len(meld.natural_cards) + num_wilds < 7:
         return 0
+    return 300 if num_wilds else 500
 
 
 def initial_meld_minimum(team_score: int) -> int:
@@ -8,14 +8,25 @@ Implements Pagat Classic Canasta scoring rules including:
 - Complete hand score calculation
 """
 from typing import List
-from canasta.cards import card_point_value
+from canasta.cards import NUM_CARDS, card_point_value
 from canasta.melds import Meld, canasta_bonus
 
+# Point value of every card ID, indexed by card ID
+_CARD_POINTS = tuple(card_point_value(card_id) for card_id in range(NUM_CARDS))
+
+# Red three bonus indexed by count (0-4): 100 each with melds, 800 for all 4;
+# -100 each without melds (no special case for all 4)
+_RED_THREE_BONUS_WITH_MELDS = (0, 100, 200, 300, 800)
+_RED_THREE_BONUS_WITHOUT_MELDS = (0, -100, -200, -300, -400)
+
+# Going out bonus indexed by (went_out, concealed)
+_GOING_OUT_BONUS = ((0, 0), (100, 200))
+
 
 def calculate_card_points(card_ids: List[int]) -> int:
     """Calculate total point value of cards.
 
-    Uses card_point_value() from cards module:
+    Looks up each card in a table precomputed from card_point_value():
     - Jokers: 50 points
     - 2s: 20 points
     - Aces: 20 points
@@ -28,7 +39,7 @@ def calculate_card_points(card_ids: List[int]) -> int:
     Returns:
         Total point value of all cards
     """
-    return sum(card_point_value(card_id) for card_id in card_ids)
+    return sum(map(_CARD_POINTS.__getitem__, card_ids))
 
 
 def calculate_meld_bonuses(melds: List[Meld]) -> int:
@@ -45,7 +56,7 @@ def calculate_meld_bonuses(melds: List[Meld]) -> int:
     Returns:
         Total bonus points from all canastas
     """
-    return sum(canasta_bonus(meld) for meld in melds)
+    return sum(map(canasta_bonus, melds))
 
 
 def calculate_red_three_bonus(red_three_count: int, has_melds: bool) -> int:
@@ -62,18 +73,11 @@ def calculate_red_three_bonus(red_three_count: int, has_melds: bool) -> int:
     Returns:
         Bonus (positive) or penalty (negative) from red threes
     """
-    if red_three_count == 0:
-        return 0
-
+    if red_three_count < 0 or red_three_count > 4:
+        raise ValueError(f"Invalid red three count: {red_three_count}")
     if has_melds:
-        # Bonus with melds: 100 each, 800 for all 4
-        if red_three_count == 4:
-            return 800
-        else:
-            return red_three_count * 100
-    else:
-        # Penalty without melds: -100 each (no special case for all 4)
-        return red_three_count * -100
+        return _RED_THREE_BONUS_WITH_MELDS[red_three_count]
+    return _RED_THREE_BONUS_WITHOUT_MELDS[red_three_count]
 
 
 def calculate_going_out_bonus(went_out: bool, concealed: bool) -> int:
@@ -91,13 +95,7 @@ def calculate_going_out_bonus(went_out: bool, concealed: bool) -> int:
     Returns:
         Going out bonus (0, 100, or 200)
     """
-    if not went_out:
-        return 0
-
-    if concealed:
-        return 200
-    else:
-        return 100
+    return _GOING_OUT_BONUS[bool(went_out)][bool(concealed)]
 
 
 def calculate_hand_score(
@@ -128,10 +126,10 @@ def calculate_hand_score(
     Returns:
         Total hand score (can be negative)
     """
-    score = 0
+    card_points = _CARD_POINTS.__getitem__
 
     # 1. Add points for melded cards
-    score += calculate_card_points(melded_cards)
+    score = sum(map(card_points, melded_cards))
 
     # 2. Add canasta bonuses
     score += calculate_meld_bonuses(melds)
@@ -144,6 +142,6 @@ def calculate_hand_score(
     score += calculate_going_out_bonus(went_out, concealed)
 
     # 5. Subtract points for cards left in hand
-    score -= calculate_card_points(hand_cards)
+    score -= sum(map(card_points, hand_cards))
 
     return score
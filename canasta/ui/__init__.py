@@ -7,6 +7,7 @@ from canasta.ui.fixtures import (
     create_frozen_pile_state,
     create_red_threes_state,
     create_terminal_state,
+    FIXTURE_BUILDERS,
     get_all_fixtures,
 )
 from canasta.ui.base import Renderer
@@ -24,6 +25,7 @@ __all__ = [
     "create_frozen_pile_state",
     "create_red_threes_state",
     "create_terminal_state",
+    "FIXTURE_BUILDERS",
     "get_all_fixtures",
     # Base
     "Renderer",
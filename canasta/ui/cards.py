@@ -15,6 +15,23 @@ SUIT_SYMBOLS = {
 }
 
 
+def _render_card(card_id: int) -> str:
+    """Build the visual string for a valid card ID."""
+    rank, suit = card_id_to_rank_suit(card_id)
+
+    # Jokers
+    if suit is None:
+        return "[JKR]"
+
+    # Regular cards with suit symbol
+    suit_symbol = SUIT_SYMBOLS[suit]
+    return f"[{rank}{suit_symbol}]"
+
+
+# Visual string of every card ID, indexed by card ID
+_CARD_STRINGS = tuple(_render_card(card_id) for card_id in range(NUM_CARDS))
+
+
 def card_to_str(card_id: int) -> str:
     """Convert card ID to visual string representation.
 
@@ -29,16 +46,7 @@ def card_to_str(card_id: int) -> str:
     """
     if card_id < 0 or card_id >= NUM_CARDS:
         raise ValueError(f"Invalid card_id: {card_id}")
-
-    rank, suit = card_id_to_rank_suit(card_id)
-
-    # Jokers
-    if suit is None:
-        return "[JKR]"
-
-    # Regular cards with suit symbol
-    suit_symbol = SUIT_SYMBOLS[suit]
-    return f"[{rank}{suit_symbol}]"
+    return _CARD_STRINGS[card_id]
 
 
 def card_back() -> str:
@@ -50,6 +58,13 @@ def card_back() -> str:
     return "[###]"
 
 
+# Plural display name of each rank, indexed by rank index
+_RANK_NAMES = (
+    "Aces", "Twos", "Threes", "Fours", "Fives", "Sixes",
+    "Sevens", "Eights", "Nines", "Tens", "Jacks", "Queens", "Kings",
+)
+
+
 def rank_display_name(rank_idx: int) -> str:
     """Get display name for a rank index.
 
@@ -59,12 +74,8 @@ def rank_display_name(rank_idx: int) -> str:
     Returns:
         Display name like "Aces", "Twos", "Kings", etc.
     """
-    rank_names = [
-        "Aces", "Twos", "Threes", "Fours", "Fives", "Sixes",
-        "Sevens", "Eights", "Nines", "Tens", "Jacks", "Queens", "Kings"
-    ]
-    if 0 <= rank_idx < len(rank_names):
-        return rank_names[rank_idx]
+    if 0 <= rank_idx < len(_RANK_NAMES):
+        return _RANK_NAMES[rank_idx]
     return f"Rank{rank_idx}"
 
 
@@ -79,8 +90,14 @@ def format_card_list(card_ids: list[int], hidden: bool = False) -> str:
         String of cards like "[A\u2660][K\u2665][10\u2666]"
     """
     if hidden:
-        return "".join(card_back() for _ in card_ids)
-    return "".join(card_to_str(c) for c in card_ids)
+        return card_back() * len(card_ids)
+    return "".join(map(card_to_str, card_ids))
+
+
+# Summary string for every possible hand size, indexed by card count
+_HAND_SUMMARIES = tuple(
+    "[1 card]" if count == 1 else f"[{count} cards]" for count in range(NUM_CARDS + 1)
+)
 
 
 def format_hand_summary(card_count: int) -> str:
@@ -92,6 +109,6 @@ def format_hand_summary(card_count: int) -> str:
     Returns:
         String like "[11 cards]"
     """
-    if card_count == 1:
-        return "[1 card]"
+    if 0 <= card_count < len(_HAND_SUMMARIES):
+        return _HAND_SUMMARIES[card_count]
     return f"[{card_count} cards]"
@@ -4,6 +4,8 @@ These fixtures create reproducible CanastaState objects with known properties
 for use in rendering and visual verification.
 """
 
+import functools
+
 import pyspiel
 from canasta.canasta_game import CanastaGame, CanastaState
 from canasta.melds import Meld
@@ -15,6 +17,25 @@ def _get_game():
     return pyspiel.load_game("python_canasta")
 
 
+def _cached_fixture(builder):
+    """Build a fixture's state once and hand out independent clones of it.
+
+    Fixture builders are deterministic, so the state only needs constructing
+    on first use; every call still returns a fresh clone that callers may
+    mutate freely.
+    """
+    template = None
+
+    @functools.wraps(builder)
+    def wrapper() -> CanastaState:
+        nonlocal template
+        if template is None:
+            template = builder()
+        return template.clone()
+
+    return wrapper
+
+
 def _card_id(rank_idx: int, suit_idx: int, deck: int = 0) -> int:
     """Convert rank, suit, deck to card ID.
 
@@ -43,6 +64,7 @@ def _setup_post_dealing_state(state: CanastaState) -> None:
     state._cards_dealt = 44  # 4 players * 11 cards
 
 
+@_cached_fixture
 def create_early_game_state() -> CanastaState:
     """Create an early game state: after dealing, full hands, no melds, empty discard.
 
@@ -142,6 +164,7 @@ def create_early_game_state() -> CanastaState:
     return state
 
 
+@_cached_fixture
 def create_mid_game_state() -> CanastaState:
     """Create a mid-game state: melds on both teams, partial hands, cards in discard.
 
@@ -242,6 +265,7 @@ def create_mid_game_state() -> CanastaState:
     return state
 
 
+@_cached_fixture
 def create_canasta_state() -> CanastaState:
     """Create a state with canastas: Team 0 has natural, Team 1 has mixed.
 
@@ -346,6 +370,7 @@ def create_canasta_state() -> CanastaState:
     return state
 
 
+@_cached_fixture
 def create_frozen_pile_state() -> CanastaState:
     """Create a state with frozen pile: wild card in discard pile.
 
@@ -431,6 +456,7 @@ def create_frozen_pile_state() -> CanastaState:
     return state
 
 
+@_cached_fixture
 def create_red_threes_state() -> CanastaState:
     """Create a state with red threes placed for both teams.
 
@@ -540,6 +566,7 @@ def create_red_threes_state() -> CanastaState:
     return state
 
 
+@_cached_fixture
 def create_terminal_state() -> CanastaState:
     """Create a terminal state: game over with final scores.
 
@@ -644,17 +671,22 @@ def create_terminal_state() -> CanastaState:
     return state
 
 
+# Fixture builders by name, for callers that only need to enumerate or pick
+# fixtures without constructing every state
+FIXTURE_BUILDERS = {
+    "early_game": create_early_game_state,
+    "mid_game": create_mid_game_state,
+    "canasta": create_canasta_state,
+    "frozen_pile": create_frozen_pile_state,
+    "red_threes": create_red_threes_state,
+    "terminal": create_terminal_state,
+}
+
+
 def get_all_fixtures() -> dict[str, CanastaState]:
     """Get all fixture states as a dictionary.
 
     Returns:
         Dictionary mapping fixture names to CanastaState objects
     """
-    return {
-        "early_game": create_early_game_state(),
-        "mid_game": create_mid_game_state(),
-        "canasta": create_canasta_state(),
-        "frozen_pile": create_frozen_pile_state(),
-        "red_threes": create_red_threes_state(),
-        "terminal": create_terminal_state(),
-    }
+    return {name: create() for name, create in FIXTURE_BUILDERS.items()}
@@ -15,7 +15,7 @@ from typing import TYPE_CHECKING
 from canasta.ui.base import Renderer
 from canasta.ui.cards import rank_display_name
 from canasta.ui.state_view import StateView, extract_state_view, MeldView
-from canasta.cards import card_id_to_rank_suit, is_joker
+from canasta.cards import NUM_CARDS, card_id_to_rank_suit, is_joker
 
 if TYPE_CHECKING:
     from canasta.canasta_game import CanastaState
@@ -44,6 +44,38 @@ SUIT_SYMBOLS = {
 }
 
 
+def _build_card_color_class(card_id: int) -> str:
+    """Compute the CSS color class for a valid card ID."""
+    if is_joker(card_id):
+        return "joker"
+
+    _, suit = card_id_to_rank_suit(card_id)
+    if suit in ("hearts", "diamonds"):
+        return "red"
+    return "black"
+
+
+def _build_card_html(card_id: int) -> str:
+    """Build the HTML span for a valid card ID."""
+    rank, suit = card_id_to_rank_suit(card_id)
+
+    if suit is None:
+        # Joker
+        return '<span class="card joker">JKR</span>'
+
+    suit_symbol = SUIT_SYMBOLS[suit]
+    color_class = _build_card_color_class(card_id)
+
+    return f'<span class="card {color_class}">{rank}{suit_symbol}</span>'
+
+
+# CSS color class and HTML span of every card ID, indexed by card ID. The
+# renderer indexes _CARD_HTML directly for cards taken from a StateView, whose
+# IDs are always valid; _card_to_html() keeps the range check for callers
+_CARD_COLOR_CLASSES = tuple(_build_card_color_class(c) for c in range(NUM_CARDS))
+_CARD_HTML = tuple(_build_card_html(c) for c in range(NUM_CARDS))
+
+
 def _card_color_class(card_id: int) -> str:
     """Get CSS class for a card's color.
 
@@ -52,14 +84,13 @@ def _card_color_class(card_id: int) -> str:
 
     Returns:
         CSS class name: 'red', 'black', or 'joker'
-    """
-    if is_joker(card_id):
-        return "joker"
 
-    _, suit = card_id_to_rank_suit(card_id)
-    if suit in ("hearts", "diamonds"):
-        return "red"
-    return "black"
+    Raises:
+        ValueError: If card_id is out of range
+    """
+    if card_id < 0 or card_id >= NUM_CARDS:
+        raise ValueError(f"Invalid card_id: {card_id}")
+    return _CARD_COLOR_CLASSES[card_id]
 
 
 def _card_to_html(card_id: int) -> str:
@@ -70,17 +101,13 @@ def _card_to_html(card_id: int) -> str:
 
     Returns:
         HTML span element like '<span class="card red">A&hearts;</span>'
-    """
-    rank, suit = card_id_to_rank_suit(card_id)
-
-    if suit is None:
-        # Joker
-        return '<span class="card joker">JKR</span>'
 
-    suit_symbol = SUIT_SYMBOLS[suit]
-    color_class = _card_color_class(card_id)
-
-    return f'<span class="card {color_class}">{rank}{suit_symbol}</span>'
+    Raises:
+        ValueError: If card_id is out of range
+    """
+    if card_id < 0 or card_id >= NUM_CARDS:
+        raise ValueError(f"Invalid card_id: {card_id}")
+    return _CARD_HTML[card_id]
 
 
 def _card_back_html() -> str:
@@ -429,7 +456,7 @@ class HTMLRenderer(Renderer):
 
         if self.is_visible_hand(player):
             # Show actual cards
-            cards_html = "".join(_card_to_html(c) for c in sorted(hand))
+            cards_html = "".join(map(_CARD_HTML.__getitem__, sorted(hand)))
             return f'<div class="hand">{cards_html}</div>'
         else:
             # Show count only
@@ -558,11 +585,7 @@ class HTMLRenderer(Renderer):
         if not team_melds:
             return '<div class="empty-melds">(no melds)</div>'
 
-        melds_html = ""
-        for meld in team_melds:
-            melds_html += self._render_meld(meld)
-
-        return melds_html
+        return "".join(map(self._render_meld, team_melds))
 
     def _render_meld(self, meld: MeldView) -> str:
         """Render a single meld.
@@ -587,8 +610,7 @@ class HTMLRenderer(Renderer):
             meld_class = "meld"
 
         # Cards
-        all_cards = meld.natural_cards + meld.wild_cards
-        cards_html = "".join(_card_to_html(c) for c in all_cards)
+        cards_html = "".join(map(_CARD_HTML.__getitem__, meld))
 
         return f'''
         <div class="{meld_class}">
@@ -666,7 +688,7 @@ class HTMLRenderer(Renderer):
         for team in range(2):
             rt_cards = view.red_threes[team]
             if rt_cards:
-                cards_html = "".join(_card_to_html(c) for c in rt_cards)
+                cards_html = "".join(map(_CARD_HTML.__getitem__, rt_cards))
                 parts.append(f"Team {team}: {cards_html}")
 
         if parts:
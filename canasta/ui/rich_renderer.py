@@ -4,14 +4,15 @@ Renders game state with colored output using the rich library,
 featuring Canasta Junction-inspired color scheme.
 """
 
-from typing import TYPE_CHECKING
+from itertools import islice
+from typing import TYPE_CHECKING, Any
 
 from rich.console import Console
 from rich.text import Text
 from rich.panel import Panel
 from rich.table import Table
 
-from canasta.cards import card_id_to_rank_suit
+from canasta.cards import NUM_CARDS, card_id_to_rank_suit
 from canasta.ui.base import Renderer
 from canasta.ui.cards import (
     card_to_str,
@@ -47,12 +48,41 @@ STYLE_HEADER = "bold #008373"
 STYLE_FOOTER = "dim"
 STYLE_WILD = "bold magenta"
 
+# Card style by suit name
+_SUIT_STYLES = {
+    "hearts": STYLE_HEARTS,
+    "diamonds": STYLE_DIAMONDS,
+    "clubs": STYLE_CLUBS,
+    "spades": STYLE_SPADES,
+}
+
 # Layout constants
 MAX_WIDTH = 80
 CENTER_WIDTH = 40
 MELD_BOX_WIDTH = 36
 
 
+def _build_card_text(card_id: int) -> Text:
+    """Build the styled Text for a valid card ID."""
+    rank, suit = card_id_to_rank_suit(card_id)
+
+    # Jokers
+    if suit is None:
+        return Text("[JKR]", style=STYLE_JOKER)
+
+    # Get suit symbol
+    suit_symbol = SUIT_SYMBOLS[suit]
+    card_str = f"[{rank}{suit_symbol}]"
+
+    return Text(card_str, style=_SUIT_STYLES[suit])
+
+
+# Styled Text of every card ID, indexed by card ID. Text is mutable, so these
+# are only passed to append_text(), which copies them; _card_styled() hands
+# out copies and keeps the range check for other callers
+_CARD_TEXTS = tuple(_build_card_text(c) for c in range(NUM_CARDS))
+
+
 class RichRenderer(Renderer):
     """Rich terminal renderer for Canasta game states.
 
@@ -65,15 +95,34 @@ class RichRenderer(Renderer):
     - Gold for natural canastas, silver for mixed
     """
 
-    def __init__(self, perspective: int = 0, show_all_hands: bool = False):
+    def __init__(
+        self,
+        perspective: int = 0,
+        show_all_hands: bool = False,
+        **console_kwargs: Any,
+    ):
         """Initialize the rich renderer.
 
         Args:
             perspective: Which player's view to render (0-3).
             show_all_hands: If True, show all players' hands (debug mode).
+            **console_kwargs: Extra arguments for rich.console.Console,
+                overriding the defaults below. The color system is detected
+                from the terminal unless one is given, e.g.
+                color_system="truecolor", no_color=False for output that is
+                the same on every machine.
         """
         super().__init__(perspective, show_all_hands)
-        self.console = Console(force_terminal=True, width=MAX_WIDTH)
+        # Output is built from Text objects, so markup, emoji and
+        # highlighting are never needed.
+        self.console = Console(**{
+            "force_terminal": True,
+            "width": MAX_WIDTH,
+            "markup": False,
+            "emoji": False,
+            "highlight": False,
+            **console_kwargs,
+        })
 
     def render(self, state: "CanastaState") -> str:
         """Render game state to colored terminal text.
@@ -121,26 +170,14 @@ class RichRenderer(Renderer):
 
         Returns:
             Text object with appropriate styling
+
+        Raises:
+            ValueError: If card_id is out of range
         """
-        rank, suit = card_id_to_rank_suit(card_id)
-
-        # Jokers
-        if suit is None:
-            return Text("[JKR]", style=STYLE_JOKER)
-
-        # Get suit symbol
-        suit_symbol = SUIT_SYMBOLS[suit]
-        card_str = f"[{rank}{suit_symbol}]"
-
-        # Apply suit-based styling
-        if suit == "hearts":
-            return Text(card_str, style=STYLE_HEARTS)
-        elif suit == "diamonds":
-            return Text(card_str, style=STYLE_DIAMONDS)
-        elif suit == "clubs":
-            return Text(card_str, style=STYLE_CLUBS)
-        else:  # spades
-            return Text(card_str, style=STYLE_SPADES)
+        if card_id < 0 or card_id >= NUM_CARDS:
+            raise ValueError(f"Invalid card_id: {card_id}")
+        # Copy so callers may append to the result without touching the table
+        return _CARD_TEXTS[card_id].copy()
 
     def _format_cards_styled(self, card_ids: list[int]) -> Text:
         """Format a list of cards with styling.
@@ -153,7 +190,7 @@ class RichRenderer(Renderer):
         """
         result = Text()
         for card_id in sorted(card_ids):
-            result.append_text(self._card_styled(card_id))
+            result.append_text(_CARD_TEXTS[card_id])
         return result
 
     def _center_text(self, text: str | Text, width: int = MAX_WIDTH) -> Text:
@@ -492,7 +529,7 @@ class RichRenderer(Renderer):
             if len(result.plain) > 70:
                 result = Text()
                 for card_id in sorted(hand)[:10]:
-                    result.append_text(self._card_styled(card_id))
+                    result.append_text(_CARD_TEXTS[card_id])
                 result.append("...", style=STYLE_FOOTER)
             return result
         else:
@@ -549,13 +586,10 @@ class RichRenderer(Renderer):
         result.append(f"  {rank_name} ({meld.total_cards}): ")
 
         # Show a few cards as preview with styling
-        all_cards = meld.natural_cards + meld.wild_cards
-        cards_to_show = all_cards[:4] if len(all_cards) > 4 else all_cards
-
-        for card_id in cards_to_show:
-            result.append_text(self._card_styled(card_id))
+        for card_id in islice(meld, 4):
+            result.append_text(_CARD_TEXTS[card_id])
 
-        if len(all_cards) > 4:
+        if meld.total_cards > 4:
             result.append("...", style=STYLE_FOOTER)
 
         # Canasta marker with special styling
@@ -584,7 +618,7 @@ class RichRenderer(Renderer):
                 part = Text()
                 part.append(f"Team {team}: ")
                 for card_id in rt_cards:
-                    part.append_text(self._card_styled(card_id))
+                    part.append_text(_CARD_TEXTS[card_id])
                 parts.append(part)
 
         if parts:
@@ -4,6 +4,7 @@ Renders game state as text output suitable for terminal display,
 using an 80-column layout with Unicode box-drawing characters.
 """
 
+from itertools import islice
 from typing import TYPE_CHECKING
 
 from canasta.ui.base import Renderer
@@ -377,11 +378,10 @@ class TextRenderer(Renderer):
         count = meld.total_cards
 
         # Show a few cards as preview
-        all_cards = meld.natural_cards + meld.wild_cards
-        if len(all_cards) <= 4:
-            cards_preview = "".join(card_to_str(c) for c in all_cards)
+        if count <= 4:
+            cards_preview = "".join(card_to_str(c) for c in meld)
         else:
-            cards_preview = "".join(card_to_str(c) for c in all_cards[:3]) + "..."
+            cards_preview = "".join(card_to_str(c) for c in islice(meld, 3)) + "..."
 
         return f"  {rank_name} ({count}): {cards_preview}{marker}"
 
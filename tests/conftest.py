@@ -1,3 +1,95 @@
 """Pytest configuration and fixtures."""
 
 import pytest
+import pyspiel
+
+# Import to register the game
+from canasta import canasta_game
+from canasta.ui.fixtures import FIXTURE_BUILDERS
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--quick",
+        action="store_true",
+        default=False,
+        help="skip tests marked slow and play fewer random games",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "slow: long multi-game runs, skipped with --quick"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if not config.getoption("quick"):
+        return
+    skip_slow = pytest.mark.skip(reason="skipped with --quick")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
+def game():
+    """Canasta game shared by the session; game objects are immutable config."""
+    return pyspiel.load_game("python_canasta")
+
+
+@pytest.fixture(scope="session")
+def _dealt_template(game):
+    """State dealt once per session by always taking the first chance outcome."""
+    state = game.new_initial_state()
+    state._deal_all_deterministic()
+    return state
+
+
+@pytest.fixture
+def dealt_state(_dealt_template):
+    """Fresh copy of a state that has finished dealing and is in play."""
+    return _dealt_template.clone()
+
+
+@pytest.fixture(scope="session")
+def fixture_states():
+    """Each UI fixture state, built once per session and keyed by name.
+
+    Rendering only reads the state, so the renderer test modules all share
+    these instead of building their own copies.
+    """
+    return {name: create() for name, create in FIXTURE_BUILDERS.items()}
+
+
+@pytest.fixture(scope="session", params=list(FIXTURE_BUILDERS))
+def fixture_name(request):
+    """Each UI fixture name in turn, for checks that apply to every state."""
+    return request.param
+
+
+@pytest.fixture(scope="session")
+def early_state(fixture_states):
+    """The early-game fixture state most render tests inspect."""
+    return fixture_states["early_game"]
+
+
+@pytest.fixture(scope="session")
+def perspective_renderers():
+    """Build a renderer class for players 0-3, once per class and settings.
+
+    Renderers only hold their settings (and a console for Rich), so every
+    test that is not exercising the constructor shares one per perspective.
+    Call as perspective_renderers(RendererClass, **kwargs).
+    """
+    cache = {}
+
+    def build(renderer_cls, **kwargs):
+        key = (renderer_cls, tuple(sorted(kwargs.items())))
+        if key not in cache:
+            cache[key] = tuple(
+                renderer_cls(perspective=p, **kwargs) for p in range(4)
+            )
+        return cache[key]
+
+    return build
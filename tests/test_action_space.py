@@ -9,12 +9,8 @@ def setup_game_to_play_phase():
     game = pyspiel.load_game("python_canasta")
     state = game.new_initial_state()
 
-    # Deal all cards
-    while state._dealing_phase:
-        if state.is_chance_node():
-            outcomes = state.chance_outcomes()
-            action = outcomes[0][0]  # Take first available card
-            state.apply_action(action)
+    # Deal all cards, always taking the first available card
+    state._deal_all_deterministic()
 
     return state
 
@@ -79,6 +79,17 @@ def test_load_game_works():
     assert len(outcomes) > 0
 
 
+def test_chance_outcomes_iter_matches_chance_outcomes():
+    """Test that the lazy chance outcome iterator matches the full list."""
+    game = pyspiel.load_game("python_canasta")
+    state = game.new_initial_state()
+
+    assert list(state.chance_outcomes_iter()) == state.chance_outcomes()
+
+    state.apply_action(next(state.chance_outcomes_iter())[0])
+    assert list(state.chance_outcomes_iter()) == state.chance_outcomes()
+
+
 def test_game_info_correct():
     """Test that game info is correct."""
     game = pyspiel.load_game("python_canasta")
@@ -43,11 +43,7 @@ def test_cannot_add_wild_to_natural_canasta():
     state = game.new_initial_state()
 
     # Deal all cards
-    while state.is_chance_node():
-        outcomes = state.chance_outcomes()
-        if not outcomes:
-            break
-        state.apply_action(outcomes[0][0])
+    state._deal_all_deterministic()
 
     # Create a natural canasta for team 0
     player = 0
@@ -100,11 +96,7 @@ def test_canasta_required_to_go_out():
     state = game.new_initial_state()
 
     # Deal all cards
-    while state.is_chance_node():
-        outcomes = state.chance_outcomes()
-        if not outcomes:
-            break
-        state.apply_action(outcomes[0][0])
+    state._deal_all_deterministic()
 
     player = 0
     team = 0
@@ -189,11 +181,7 @@ def test_canasta_count_accurate():
     state = game.new_initial_state()
 
     # Deal all cards
-    while state.is_chance_node():
-        outcomes = state.chance_outcomes()
-        if not outcomes:
-            break
-        state.apply_action(outcomes[0][0])
+    state._deal_all_deterministic()
 
     team = 0
 
@@ -145,6 +145,11 @@ class TestWildCards:
         for card_id in non_wild_ids:
             assert not is_wild(card_id)
 
+    def test_wild_card_count(self):
+        """Exactly the eight 2s and four jokers are wild."""
+        wild_ids = [i for i in range(NUM_CARDS) if is_wild(i)]
+        assert wild_ids == [1, 14, 27, 40, 53, 66, 79, 92, 104, 105, 106, 107]
+
 
 class TestThreeDetection:
     """Test red and black three detection."""
@@ -1,8 +1,10 @@
 """Tests for Going Out mechanics in Canasta."""
 
+import random
+
 import pyspiel
 from canasta.canasta_game import CanastaGame
-from canasta.cards import cards_of_rank
+from canasta.cards import NUM_CARDS, cards_of_rank, is_wild, rank_of
 from canasta.melds import Meld
 
 
@@ -379,3 +381,69 @@ def test_classic_canasta_requires_one_canasta():
     assert state._canastas[0] == 1
 
     # Should be able to go out (Classic rule: 1 canasta sufficient)
+
+
+def test_go_out_discard_is_the_unmatched_single():
+    """Test that the lone unmeldable card is chosen as the go-out discard."""
+    sevens = cards_of_rank(6)
+    canasta = Meld(rank=6, natural_cards=sevens[:7], wild_cards=[])
+
+    # A pair of eights can form a new meld, the single nine cannot
+    eights = cards_of_rank(7)[:2]
+    nine = cards_of_rank(8)[0]
+    state = setup_game_for_going_out(
+        player_hand=eights + [nine],
+        team_melds=[canasta]
+    )
+
+    assert state._can_meld_all_but_one()
+    assert state._find_go_out_discard(state._hands[0], 0) == nine
+
+    # Two unmatched singles can never leave a meldable hand
+    state._hands[0] = eights + [nine, cards_of_rank(9)[0]]
+    assert not state._can_meld_all_but_one()
+
+
+def _can_meld_all_cards(cards, melds):
+    """Reference check: can every card be melded given the team's melds?
+
+    The straightforward rule _find_go_out_discard() is optimized from: each
+    natural rank must either extend an existing meld or have at least two
+    naturals to start a new one; wilds can always be placed.
+    """
+    cards_by_rank = {}
+    for card in cards:
+        if not is_wild(card):
+            cards_by_rank.setdefault(rank_of(card), []).append(card)
+
+    melded_ranks = {meld.rank for meld in melds}
+    return all(
+        rank in melded_ranks or len(rank_cards) >= 2
+        for rank, rank_cards in cards_by_rank.items()
+    )
+
+
+def _reference_go_out_discard(hand, melds):
+    """First card whose removal leaves a fully meldable hand, by brute force."""
+    for card in hand:
+        remaining = [c for c in hand if c != card]
+        if _can_meld_all_cards(remaining, melds):
+            return card
+    return None
+
+
+def test_go_out_discard_matches_reference_on_random_hands():
+    """_find_go_out_discard() agrees with the brute-force reference."""
+    rng = random.Random(0)
+    state = setup_game_for_going_out()
+
+    for _ in range(2000):
+        hand = rng.sample(range(NUM_CARDS), rng.randint(1, 8))
+        melds = [
+            Meld(rank=rank, natural_cards=[], wild_cards=[])
+            for rank in rng.sample(range(13), rng.randint(0, 3))
+        ]
+        state._melds[0] = melds
+
+        assert state._find_go_out_discard(hand, 0) == _reference_go_out_discard(hand, melds), \
+            f"hand={hand} melded ranks={[m.rank for m in melds]}"
@@ -21,12 +21,7 @@ def state(game):
 
 def deal_to_playing_phase(state):
     """Deal cards until we reach the playing phase."""
-    while state.is_chance_node():
-        outcomes = state.chance_outcomes()
-        if not outcomes:
-            break
-        action = outcomes[0][0]
-        state.apply_action(action)
+    state._deal_all_deterministic()
     return state
 
 
@@ -53,11 +53,7 @@ def test_observation_tensor_generation_fast():
     state = game.new_initial_state()
 
     # Deal all cards
-    while state.is_chance_node():
-        outcomes = state.chance_outcomes()
-        if not outcomes:
-            break
-        state.apply_action(outcomes[0][0])
+    state._deal_all_deterministic()
 
     # Time observation tensor generation
     start = time.time()
@@ -79,11 +75,7 @@ def test_legal_actions_generation_fast():
     state = game.new_initial_state()
 
     # Deal all cards
-    while state.is_chance_node():
-        outcomes = state.chance_outcomes()
-        if not outcomes:
-            break
-        state.apply_action(outcomes[0][0])
+    state._deal_all_deterministic()
 
     # Time legal action generation
     start = time.time()
@@ -127,11 +119,7 @@ def test_serialization_speed():
     state = game.new_initial_state()
 
     # Deal all cards
-    while state.is_chance_node():
-        outcomes = state.chance_outcomes()
-        if not outcomes:
-            break
-        state.apply_action(outcomes[0][0])
+    state._deal_all_deterministic()
 
     # Time serialization
     start = time.time()
@@ -152,11 +140,7 @@ def test_clone_speed():
     state = game.new_initial_state()
 
     # Deal all cards
-    while state.is_chance_node():
-        outcomes = state.chance_outcomes()
-        if not outcomes:
-            break
-        state.apply_action(outcomes[0][0])
+    state._deal_all_deterministic()
 
     # Time cloning
     start = time.time()
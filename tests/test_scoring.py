@@ -80,29 +80,30 @@ class TestMeldBonuses:
 class TestRedThreeBonus:
     """Test red three bonus/penalty calculations."""
 
-    def test_red_three_bonus_one_red_three(self):
-        """One red three with melds earns 100 bonus."""
-        assert calculate_red_three_bonus(1, has_melds=True) == 100
-
-    def test_red_three_bonus_two_red_threes(self):
-        """Two red threes with melds earn 200 bonus."""
-        assert calculate_red_three_bonus(2, has_melds=True) == 200
-
-    def test_red_three_bonus_three_red_threes(self):
-        """Three red threes with melds earn 300 bonus."""
-        assert calculate_red_three_bonus(3, has_melds=True) == 300
-
-    def test_red_three_bonus_all_four(self):
-        """All four red threes with melds earn 800 bonus."""
-        assert calculate_red_three_bonus(4, has_melds=True) == 800
-
-    def test_red_three_penalty_no_melds(self):
-        """Red threes without melds are -100 each."""
-        assert calculate_red_three_bonus(2, has_melds=False) == -200
-
-    def test_red_three_penalty_all_four_no_melds(self):
-        """All four red threes without melds are -400 (not -800)."""
-        assert calculate_red_three_bonus(4, has_melds=False) == -400
+    @pytest.mark.parametrize("red_three_count,has_melds,expected", [
+        # With melds: 100 each, 800 for all four
+        (0, True, 0),
+        (1, True, 100),
+        (2, True, 200),
+        (3, True, 300),
+        (4, True, 800),
+        # Without melds: -100 each, -400 (not -800) for all four
+        (0, False, 0),
+        (1, False, -100),
+        (2, False, -200),
+        (3, False, -300),
+        (4, False, -400),
+    ])
+    def test_red_three_bonus(self, red_three_count, has_melds, expected):
+        """Red three bonus/penalty for each count with and without melds."""
+        assert calculate_red_three_bonus(red_three_count, has_melds) == expected
+
+    @pytest.mark.parametrize("red_three_count", [-1, 5])
+    @pytest.mark.parametrize("has_melds", [True, False])
+    def test_red_three_bonus_invalid_count(self, red_three_count, has_melds):
+        """Counts outside 0-4 raise instead of indexing the bonus tables."""
+        with pytest.raises(ValueError):
+            calculate_red_three_bonus(red_three_count, has_melds)
 
 
 class TestGoingOutBonus:
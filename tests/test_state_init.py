@@ -13,45 +13,21 @@ import pyspiel
 
 # Import canasta_game to register it with OpenSpiel
 from canasta import canasta_game
-from canasta.cards import is_red_three, NUM_CARDS
+from canasta.cards import RED_THREE_IDS, NUM_CARDS
 from canasta.deck import NUM_PLAYERS, HAND_SIZE
 
 
-def deal_all_cards(state):
-    """Helper to deal all cards through chance nodes until dealing is complete.
-
-    Args:
-        state: CanastaState in dealing phase
-
-    Returns:
-        state after all dealing is complete
-    """
-    while state.current_player() == pyspiel.PlayerId.CHANCE and not state.is_terminal():
-        # Get legal actions (indices into remaining deck)
-        legal_actions = state.legal_actions()
-        if not legal_actions:
-            break
-        # Apply the first legal action (deal first card in deck)
-        state.apply_action(legal_actions[0])
-    return state
-
-
-def test_dealing_starts_at_chance_node():
+def test_dealing_starts_at_chance_node(game):
     """Test that initial state starts with chance player for dealing."""
-    game = pyspiel.load_game("python_canasta")
     state = game.new_initial_state()
 
     assert state.current_player() == pyspiel.PlayerId.CHANCE
     assert not state.is_terminal()
 
 
-def test_dealing_phase_deals_correct_number_of_cards():
+def test_dealing_phase_deals_correct_number_of_cards(dealt_state):
     """Test that dealing through chance nodes deals exactly 11 cards to each player."""
-    game = pyspiel.load_game("python_canasta")
-    state = game.new_initial_state()
-
-    # Deal all cards
-    state = deal_all_cards(state)
+    state = dealt_state
 
     # After dealing, each player should have exactly 11 cards (excluding red 3s)
     # Note: Red 3s are replaced, so each hand should have 11 cards total
@@ -60,49 +36,29 @@ def test_dealing_phase_deals_correct_number_of_cards():
         assert len(hand) == HAND_SIZE, f"Player {player_idx} has {len(hand)} cards, expected {HAND_SIZE}"
 
 
-def test_all_cards_accounted_for():
+def test_all_cards_accounted_for(dealt_state):
     """Test that all 108 cards are accounted for after dealing."""
-    game = pyspiel.load_game("python_canasta")
-    state = game.new_initial_state()
-
-    # Deal all cards
-    state = deal_all_cards(state)
-
-    # Count all cards
-    total_cards = 0
-
-    # Cards in hands
-    for hand in state._hands:
-        total_cards += len(hand)
-
-    # Cards in stock
-    total_cards += len(state._stock)
+    state = dealt_state
 
-    # Cards in discard pile
-    total_cards += len(state._discard_pile)
-
-    # Red 3s that were set aside (should be tracked separately)
-    # Access the red_threes attribute if it exists
-    if hasattr(state, '_red_threes'):
-        for team_red_threes in state._red_threes:
-            total_cards += len(team_red_threes)
+    # Count all cards: hands, stock, discard pile and the red 3s set aside
+    total_cards = (
+        sum(map(len, state._hands))
+        + len(state._stock)
+        + len(state._discard_pile)
+        + sum(map(len, state._red_threes))
+    )
 
     assert total_cards == NUM_CARDS, f"Total cards: {total_cards}, expected {NUM_CARDS}"
 
 
-def test_red_threes_handled_correctly():
+def test_red_threes_handled_correctly(dealt_state):
     """Test that red 3s are properly removed from hands and replaced."""
-    game = pyspiel.load_game("python_canasta")
-    state = game.new_initial_state()
-
-    # Deal all cards
-    state = deal_all_cards(state)
+    state = dealt_state
 
     # Check that no red 3s remain in player hands
     for player_idx in range(NUM_PLAYERS):
         hand = state._hands[player_idx]
-        for card in hand:
-            assert not is_red_three(card), f"Player {player_idx} has red 3 (card {card}) in hand"
+        assert RED_THREE_IDS.isdisjoint(hand), f"Player {player_idx} has a red 3 in hand: {hand}"
 
     # Red 3s should be tracked separately (if implemented)
     # This assumes _red_threes attribute exists
@@ -110,17 +66,13 @@ def test_red_threes_handled_correctly():
         # Each team should have red 3s tracked
         assert len(state._red_threes) == 2  # 2 teams
         for team_idx in range(2):
-            for card in state._red_threes[team_idx]:
-                assert is_red_three(card), f"Non-red-3 card {card} in team {team_idx} red 3s"
+            red_threes = state._red_threes[team_idx]
+            assert RED_THREE_IDS.issuperset(red_threes), f"Non-red-3 card in team {team_idx} red 3s: {red_threes}"
 
 
-def test_stock_and_discard_sizes():
+def test_stock_and_discard_sizes(dealt_state):
     """Test that stock and discard pile have correct sizes after dealing."""
-    game = pyspiel.load_game("python_canasta")
-    state = game.new_initial_state()
-
-    # Deal all cards
-    state = deal_all_cards(state)
+    state = dealt_state
 
     # After dealing:
     # - 4 players × 11 cards = 44 cards in hands
@@ -133,22 +85,17 @@ def test_stock_and_discard_sizes():
 
     # Stock should have remaining cards
     # Expected: 108 - 44 (hands) - 1 (discard) - red_3s_count = 63 - red_3s_count
-    cards_in_hands = sum(len(hand) for hand in state._hands)
+    cards_in_hands = sum(map(len, state._hands))
     cards_in_discard = len(state._discard_pile)
     cards_in_stock = len(state._stock)
-
-    if hasattr(state, '_red_threes'):
-        red_threes_count = sum(len(team_red_threes) for team_red_threes in state._red_threes)
-    else:
-        red_threes_count = 0
+    red_threes_count = sum(map(len, state._red_threes))
 
     total = cards_in_hands + cards_in_discard + cards_in_stock + red_threes_count
     assert total == NUM_CARDS, f"Cards in hands: {cards_in_hands}, discard: {cards_in_discard}, stock: {cards_in_stock}, red 3s: {red_threes_count}, total: {total}"
 
 
-def test_state_transitions_from_dealing_to_play():
+def test_state_transitions_from_dealing_to_play(game):
     """Test that state correctly transitions from dealing to playing phase."""
-    game = pyspiel.load_game("python_canasta")
     state = game.new_initial_state()
 
     # Initially in dealing phase
@@ -156,7 +103,7 @@ def test_state_transitions_from_dealing_to_play():
     assert state.current_player() == pyspiel.PlayerId.CHANCE
 
     # Deal all cards
-    state = deal_all_cards(state)
+    state._deal_all_deterministic()
 
     # After dealing, should be in playing phase
     assert state._game_phase == "playing"
@@ -164,24 +111,22 @@ def test_state_transitions_from_dealing_to_play():
     assert state.current_player() in range(NUM_PLAYERS)
 
 
-def test_dealing_phase_tracking():
+def test_dealing_phase_tracking(game):
     """Test that dealing phase flag is correctly updated."""
-    game = pyspiel.load_game("python_canasta")
     state = game.new_initial_state()
 
     # Initially dealing
     assert state._dealing_phase is True
 
     # Deal all cards
-    state = deal_all_cards(state)
+    state._deal_all_deterministic()
 
     # After dealing complete
     assert state._dealing_phase is False
 
 
-def test_cards_dealt_counter():
+def test_cards_dealt_counter(game):
     """Test that cards_dealt counter is correctly incremented during dealing."""
-    game = pyspiel.load_game("python_canasta")
     state = game.new_initial_state()
 
     # Initially no cards dealt
@@ -194,16 +139,15 @@ def test_cards_dealt_counter():
         assert state._cards_dealt == 1
 
     # Deal all remaining cards
-    state = deal_all_cards(state)
+    state._deal_all_deterministic()
 
     # Should have dealt at least 44 cards (4 players × 11 cards)
     # May be more if red 3s were replaced
     assert state._cards_dealt >= NUM_PLAYERS * HAND_SIZE
 
 
-def test_player_assignment_during_dealing():
+def test_player_assignment_during_dealing(game):
     """Test that cards are dealt to players in correct order."""
-    game = pyspiel.load_game("python_canasta")
     state = game.new_initial_state()
 
     # Track which player should receive each card
@@ -229,26 +173,41 @@ def test_player_assignment_during_dealing():
     assert state._cards_dealt >= NUM_PLAYERS * HAND_SIZE
 
 
-def test_no_cards_in_hands_before_dealing():
+def test_no_cards_in_hands_before_dealing(game):
     """Test that all hands are empty before dealing starts."""
-    game = pyspiel.load_game("python_canasta")
     state = game.new_initial_state()
 
     for player_idx in range(NUM_PLAYERS):
         assert len(state._hands[player_idx]) == 0, f"Player {player_idx} should have empty hand initially"
 
 
-def test_discard_pile_initialized_after_dealing():
+def test_discard_pile_initialized_after_dealing(game):
     """Test that discard pile is properly initialized after dealing."""
-    game = pyspiel.load_game("python_canasta")
     state = game.new_initial_state()
 
     # Initially empty
     assert len(state._discard_pile) == 0
 
     # Deal all cards
-    state = deal_all_cards(state)
+    state._deal_all_deterministic()
 
     # After dealing, should have initial discard card
     assert len(state._discard_pile) > 0
     assert state._discard_pile[0] in range(NUM_CARDS)
+
+
+def test_deal_all_deterministic_matches_first_outcome_dealing(game):
+    """Test that the bulk deal matches always taking the first chance outcome."""
+    expected = game.new_initial_state()
+    while expected.is_chance_node():
+        expected.apply_action(expected.chance_outcomes()[0][0])
+
+    state = game.new_initial_state()
+    state._deal_all_deterministic()
+
+    assert not state.is_chance_node()
+    assert state._hands == expected._hands
+    assert state._stock == expected._stock
+    assert state._discard_pile == expected._discard_pile
+    assert state._red_threes == expected._red_threes
+    assert state.history() == expected.history()
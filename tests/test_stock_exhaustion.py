@@ -7,22 +7,12 @@ Pagat Rules for Stock Exhaustion:
 4. The turn player who cannot draw loses the hand
 """
 
-import pyspiel
-from canasta.canasta_game import CanastaGame
+from canasta.canasta_game import ACTION_DRAW_STOCK
 
 
-def test_stock_empty_cannot_take_pile_ends_hand():
+def test_stock_empty_cannot_take_pile_ends_hand(dealt_state):
     """Test that hand ends when stock is empty and pile cannot be taken."""
-    game = CanastaGame()
-    state = game.new_initial_state()
-
-    # Deal all cards to finish dealing phase
-    while state.is_chance_node():
-        outcomes = state.chance_outcomes()
-        if not outcomes:
-            break
-        # Take first available card
-        state.apply_action(outcomes[0][0])
+    state = dealt_state
 
     # Simulate gameplay until we can engineer stock exhaustion
     # We need to empty the stock and ensure pile cannot be taken
@@ -31,12 +21,6 @@ def test_stock_empty_cannot_take_pile_ends_hand():
     assert hasattr(state, '_discard_pile')
 
     # Create a scenario where stock is empty
-    # Save current state
-    original_stock = state._stock.copy()
-    original_phase = state._turn_phase
-    original_game_phase = state._game_phase
-
-    # Empty the stock
     state._stock = []
     state._turn_phase = "draw"
     state._game_phase = "playing"  # Ensure we're in playing phase
@@ -55,23 +39,10 @@ def test_stock_empty_cannot_take_pile_ends_hand():
     # After finalization, either terminal or new hand started (dealing phase)
     assert state.is_terminal() or state._game_phase == "dealing"
 
-    # Restore state for other tests
-    state._stock = original_stock
-    state._turn_phase = original_phase
-    state._game_phase = original_game_phase
 
-
-def test_stock_empty_can_take_pile_continues():
+def test_stock_empty_can_take_pile_continues(dealt_state):
     """Test that game continues when stock is empty but pile can be taken."""
-    game = CanastaGame()
-    state = game.new_initial_state()
-
-    # Deal all cards
-    while state.is_chance_node():
-        outcomes = state.chance_outcomes()
-        if not outcomes:
-            break
-        state.apply_action(outcomes[0][0])
+    state = dealt_state
 
     # Create a scenario where stock is empty but pile can be taken
     # We need:
@@ -86,9 +57,6 @@ def test_stock_empty_can_take_pile_continues():
     # This is tested in the draw phase tests, but we verify it handles
     # empty stock correctly
 
-    # Save state
-    original_stock = state._stock.copy()
-
     # Empty stock
     state._stock = []
 
@@ -100,48 +68,28 @@ def test_stock_empty_can_take_pile_continues():
         # Either have legal actions or already moved to next phase
         assert len(legal) > 0 or state._turn_phase != "draw"
 
-    # Restore
-    state._stock = original_stock
-
 
-def test_last_stock_card_is_red_three():
+def test_last_stock_card_is_red_three(dealt_state):
     """Test special handling when last stock card is a red three."""
-    game = CanastaGame()
-    state = game.new_initial_state()
-
-    # Deal all cards
-    while state.is_chance_node():
-        outcomes = state.chance_outcomes()
-        if not outcomes:
-            break
-        state.apply_action(outcomes[0][0])
-
-    # Test that red three replacement logic handles empty stock
-    # This is already tested in the draw phase tests, but we verify
-    # the logic in _apply_draw_stock handles it correctly
-
-    # The key code is in _apply_draw_stock:
-    # if self._stock:
-    #     card = self._stock.pop(0)
-    #     ...
-    # else:
-    #     break  # No replacement available
+    state = dealt_state
 
-    # This prevents infinite loops when stock is empty
-    assert hasattr(state, '_apply_draw_stock')
+    player = state._current_player
+    team = player % 2
+    hand_before = list(state._hands[player])
 
+    # Only a red three left: it is set aside and no replacement is drawn,
+    # rather than looping on the empty stock
+    state._stock = [15]
+    state.apply_action(ACTION_DRAW_STOCK)
 
-def test_stock_exhaustion_scoring_no_go_out_bonus():
-    """Test that no go-out bonus is awarded when stock is exhausted."""
-    game = CanastaGame()
-    state = game.new_initial_state()
+    assert state._hands[player] == hand_before
+    assert state._red_threes[team][-1] == 15
+    assert state._stock == []
 
-    # Deal all cards
-    while state.is_chance_node():
-        outcomes = state.chance_outcomes()
-        if not outcomes:
-            break
-        state.apply_action(outcomes[0][0])
+
+def test_stock_exhaustion_scoring_no_go_out_bonus(dealt_state):
+    """Test that no go-out bonus is awarded when stock is exhausted."""
+    state = dealt_state
 
     # Verify that _finalize_game accepts winning_team=-1
     # This indicates stock exhaustion (no team went out)
@@ -151,21 +99,9 @@ def test_stock_exhaustion_scoring_no_go_out_bonus():
     # This is handled in calculate_hand_score with went_out=False
 
 
-def test_stock_exhaustion_both_teams_scored():
+def test_stock_exhaustion_both_teams_scored(dealt_state):
     """Test that both teams are scored when stock is exhausted."""
-    game = CanastaGame()
-    state = game.new_initial_state()
-
-    # Deal all cards
-    while state.is_chance_node():
-        outcomes = state.chance_outcomes()
-        if not outcomes:
-            break
-        state.apply_action(outcomes[0][0])
-
-    # Save original scores
-    original_team_scores = state._team_scores.copy()
-    original_hand_scores = state._hand_scores.copy()
+    state = dealt_state
 
     # Simulate stock exhaustion
     state._stock = []
@@ -183,17 +119,9 @@ def test_stock_exhaustion_both_teams_scored():
     assert len(state._hand_scores) == 2
 
 
-def test_stock_exhaustion_hand_cards_subtracted():
+def test_stock_exhaustion_hand_cards_subtracted(dealt_state):
     """Test that hand cards are subtracted from score when stock exhausted."""
-    game = CanastaGame()
-    state = game.new_initial_state()
-
-    # Deal all cards
-    while state.is_chance_node():
-        outcomes = state.chance_outcomes()
-        if not outcomes:
-            break
-        state.apply_action(outcomes[0][0])
+    state = dealt_state
 
     # The scoring logic subtracts hand cards in calculate_hand_score
     # This is tested in test_scoring.py, but we verify it applies
@@ -223,17 +151,9 @@ def test_stock_exhaustion_hand_cards_subtracted():
     assert isinstance(score, int)
 
 
-def test_stock_exhaustion_triggers_new_hand():
+def test_stock_exhaustion_triggers_new_hand(dealt_state):
     """Test that stock exhaustion triggers a new hand if target not reached."""
-    game = CanastaGame()
-    state = game.new_initial_state()
-
-    # Deal all cards
-    while state.is_chance_node():
-        outcomes = state.chance_outcomes()
-        if not outcomes:
-            break
-        state.apply_action(outcomes[0][0])
+    state = dealt_state
 
     # Verify that _start_new_hand exists and is called
     # when target score not reached after stock exhaustion
@@ -258,17 +178,9 @@ def test_stock_exhaustion_triggers_new_hand():
     assert state._hand_number == original_hand_number + 1
 
 
-def test_stock_exhaustion_at_5000_ends_game():
+def test_stock_exhaustion_at_5000_ends_game(dealt_state):
     """Test that stock exhaustion ends game when team reaches 5000."""
-    game = CanastaGame()
-    state = game.new_initial_state()
-
-    # Deal all cards
-    while state.is_chance_node():
-        outcomes = state.chance_outcomes()
-        if not outcomes:
-            break
-        state.apply_action(outcomes[0][0])
+    state = dealt_state
 
     # Set team score high enough that finalization will reach target
     # Note: _finalize_game will calculate hand scores (which may be negative
@@ -282,7 +194,7 @@ def test_stock_exhaustion_at_5000_ends_game():
     state._melds[0].append(Meld(rank=5, natural_cards=[20, 21, 22, 23, 24, 25, 26], wild_cards=[]))
 
     # Clear hands to avoid negative points
-    state._hands = [[], [], [], []]
+    state._clear_hands()
 
     # Ensure we're in playing phase, not dealing
     state._game_phase = "playing"
@@ -300,17 +212,9 @@ def test_stock_exhaustion_at_5000_ends_game():
     assert state._winning_team == 0
 
 
-def test_frozen_pile_with_empty_stock():
+def test_frozen_pile_with_empty_stock(dealt_state):
     """Test frozen pile behavior when stock is empty."""
-    game = CanastaGame()
-    state = game.new_initial_state()
-
-    # Deal all cards
-    while state.is_chance_node():
-        outcomes = state.chance_outcomes()
-        if not outcomes:
-            break
-        state.apply_action(outcomes[0][0])
+    state = dealt_state
 
     # Test frozen pile logic with empty stock
     # Pile is frozen if:
@@ -331,17 +235,9 @@ def test_frozen_pile_with_empty_stock():
     assert is_frozen == True
 
 
-def test_multiple_stock_exhaustions_in_game():
+def test_multiple_stock_exhaustions_in_game(dealt_state):
     """Test that game handles multiple stock exhaustions across hands."""
-    game = CanastaGame()
-    state = game.new_initial_state()
-
-    # Deal all cards
-    while state.is_chance_node():
-        outcomes = state.chance_outcomes()
-        if not outcomes:
-            break
-        state.apply_action(outcomes[0][0])
+    state = dealt_state
 
     # Verify that multiple hands can be played
     # Each hand should properly reset the stock
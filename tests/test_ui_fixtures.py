@@ -17,71 +17,39 @@ from canasta.ui.fixtures import (
     create_frozen_pile_state,
     create_red_threes_state,
     create_terminal_state,
+    FIXTURE_BUILDERS,
     get_all_fixtures,
 )
-from canasta.cards import is_wild, is_red_three, NUM_CARDS
+from canasta.cards import RED_THREE_IDS, is_wild, NUM_CARDS
 from canasta.melds import is_canasta, is_natural_canasta, is_mixed_canasta
 
+_FIXTURE_BUILDERS = tuple(FIXTURE_BUILDERS.values())
+
 
 class TestFixtureDeterminism:
     """Test that fixtures produce deterministic results."""
 
-    def test_early_game_state_deterministic(self):
-        """Early game state should be identical on repeated calls."""
-        state1 = create_early_game_state()
-        state2 = create_early_game_state()
-
-        for player_idx in range(4):
-            assert state1._hands[player_idx] == state2._hands[player_idx]
+    @pytest.mark.parametrize("create", _FIXTURE_BUILDERS, ids=lambda f: f.__name__)
+    def test_fixture_deterministic(self, create):
+        """Building a fixture twice should give identical states."""
+        # serialize() covers hands, piles, melds, red threes, scores and
+        # phase flags, so one string compare checks the whole state
+        assert create.__wrapped__().serialize() == create.__wrapped__().serialize()
 
-        assert state1._discard_pile == state2._discard_pile
-        assert state1._stock == state2._stock
-
-    def test_mid_game_state_deterministic(self):
-        """Mid game state should be identical on repeated calls."""
+    def test_fixture_calls_return_independent_states(self):
+        """Mutating one fixture state should not affect later calls."""
         state1 = create_mid_game_state()
-        state2 = create_mid_game_state()
-
-        for player_idx in range(4):
-            assert state1._hands[player_idx] == state2._hands[player_idx]
-
-        for team_idx in range(2):
-            assert len(state1._melds[team_idx]) == len(state2._melds[team_idx])
-            for i, meld in enumerate(state1._melds[team_idx]):
-                assert meld.rank == state2._melds[team_idx][i].rank
-                assert meld.natural_cards == state2._melds[team_idx][i].natural_cards
-                assert meld.wild_cards == state2._melds[team_idx][i].wild_cards
+        state1._hands[0].clear()
+        state1._melds[0][0].natural_cards.append(0)
 
-    def test_canasta_state_deterministic(self):
-        """Canasta state should be identical on repeated calls."""
-        state1 = create_canasta_state()
-        state2 = create_canasta_state()
-
-        assert state1._canastas == state2._canastas
-
-    def test_frozen_pile_state_deterministic(self):
-        """Frozen pile state should be identical on repeated calls."""
-        state1 = create_frozen_pile_state()
-        state2 = create_frozen_pile_state()
-
-        assert state1._discard_pile == state2._discard_pile
-        assert state1._pile_frozen == state2._pile_frozen
-
-    def test_red_threes_state_deterministic(self):
-        """Red threes state should be identical on repeated calls."""
-        state1 = create_red_threes_state()
-        state2 = create_red_threes_state()
-
-        assert state1._red_threes == state2._red_threes
-
-    def test_terminal_state_deterministic(self):
-        """Terminal state should be identical on repeated calls."""
-        state1 = create_terminal_state()
-        state2 = create_terminal_state()
+        state2 = create_mid_game_state()
+        assert state2._hands[0]
+        assert state2._melds[0][0].natural_cards != state1._melds[0][0].natural_cards
 
-        assert state1._team_scores == state2._team_scores
-        assert state1._returns == state2._returns
-        assert state1._winning_team == state2._winning_team
+    def test_cached_fixtures_match_fresh_builds(self):
+        """Cached fixture clones should match a freshly built state."""
+        for create in _FIXTURE_BUILDERS:
+            assert create().serialize() == create.__wrapped__().serialize()
 
 
 class TestEarlyGameState:
@@ -130,13 +98,12 @@ class TestEarlyGameState:
     def test_all_cards_accounted_for(self):
         """All 108 cards should be accounted for."""
         state = create_early_game_state()
-        total = 0
-        for hand in state._hands:
-            total += len(hand)
-        total += len(state._discard_pile)
-        total += len(state._stock)
-        for rt in state._red_threes:
-            total += len(rt)
+        total = (
+            sum(map(len, state._hands))
+            + len(state._discard_pile)
+            + len(state._stock)
+            + sum(map(len, state._red_threes))
+        )
 
         assert total == NUM_CARDS
 
@@ -244,15 +211,15 @@ class TestRedThreesState:
         """All red threes should be valid red three cards."""
         state = create_red_threes_state()
         for team_idx in range(2):
-            for card in state._red_threes[team_idx]:
-                assert is_red_three(card), f"Card {card} should be a red three"
+            assert RED_THREE_IDS.issuperset(state._red_threes[team_idx]), \
+                f"Team {team_idx} has non-red-three cards: {state._red_threes[team_idx]}"
 
     def test_no_red_threes_in_hands(self):
         """No red threes should be in player hands."""
         state = create_red_threes_state()
         for player_idx in range(4):
-            for card in state._hands[player_idx]:
-                assert not is_red_three(card), f"Red three found in player {player_idx}'s hand"
+            assert RED_THREE_IDS.isdisjoint(state._hands[player_idx]), \
+                f"Red three found in player {player_idx}'s hand"
 
 
 class TestTerminalState:
@@ -304,12 +271,11 @@ class TestGetAllFixtures:
 
     def test_returns_all_fixtures(self):
         """Should return all 6 fixtures."""
-        fixtures = get_all_fixtures()
-        assert len(fixtures) == 6
+        assert len(FIXTURE_BUILDERS) == 6
 
     def test_fixture_names(self):
         """Should have expected fixture names."""
-        fixtures = get_all_fixtures()
+        fixtures = FIXTURE_BUILDERS
         expected_names = {
             "early_game",
             "mid_game",
@@ -323,6 +289,7 @@ class TestGetAllFixtures:
     def test_all_fixtures_are_states(self):
         """All fixtures should be CanastaState objects."""
         fixtures = get_all_fixtures()
+        assert fixtures.keys() == FIXTURE_BUILDERS.keys()
         for name, state in fixtures.items():
             assert hasattr(state, '_hands'), f"{name} should have _hands attribute"
             assert hasattr(state, '_melds'), f"{name} should have _melds attribute"
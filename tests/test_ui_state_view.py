@@ -38,6 +38,15 @@ class TestMeldView:
         )
         assert meld.all_cards == [1, 2, 3, 100, 101]
 
+    def test_iter_matches_all_cards(self):
+        """Iterating a MeldView yields the same cards as all_cards."""
+        meld = MeldView(
+            rank=0,
+            natural_cards=[1, 2, 3],
+            wild_cards=[100, 101],
+        )
+        assert list(meld) == meld.all_cards
+
     def test_canasta_flags(self):
         """MeldView canasta flags are stored correctly."""
         meld = MeldView(